@@ -0,0 +1,248 @@
+import streamlit as st
+import math
+import numpy as np
+from datetime import date
+
+# Max bleed days allowed for each rounded cycle length (indexed by cycle)
+_MAX_BLEED = tuple([10] * 21 + [5, 6, 7, 8, 9] + [10] * 11)
+
+# Position of each phase in the timeline returned by predict()
+_PHASE_INDICES = {"bleed": 0, "power_week": 1, "crash1": 2, "nurture": 3, "crash2": 4}
+
+# ==========================================
+# HELPER FUNCTION (CLIENT LOGIC)
+# ==========================================
+def apply_custom_rounding(value: float) -> int:
+    """
+    Client Requirement:
+    - Decimal <= 0.5 -> Round DOWN (Floor)
+    - Decimal >= 0.6 -> Round UP (Ceil)
+
+    Inputs are never negative, so floor(value + 0.4) covers both cases:
+    e.g. 5.6 -> 6.0 -> 6, 5.59 -> 5.99 -> 5.
+    """
+    return int(value + 0.4)
+
+# ==========================================
+# CORE LOGIC CLASSES
+# ==========================================
+
+class CycleHistoryCalculator:
+    def validate_single_entry(self, start_date: date, end_date: date) -> int:
+        return _validate_bleed_duration(start_date, end_date)
+
+    def process_history(self, starts, ends):
+        if not starts:
+            return None
+        return _process_history_cached(tuple(starts), tuple(ends))
+
+class OvulationPredictor:
+    CRASH_1 = 2
+    NURTURE = 6
+    CRASH_2 = 3
+    CONSTANTS_SUM = CRASH_1 + NURTURE + CRASH_2
+
+    def predict(self, start_date_obj: date, raw_bleed: float, raw_cycle: float):
+        return _predict_cached(start_date_obj, raw_bleed, raw_cycle)
+
+# ==========================================
+# CACHED COMPUTATIONS
+# ==========================================
+
+@st.cache_resource
+def get_history_calc() -> CycleHistoryCalculator:
+    return CycleHistoryCalculator()
+
+@st.cache_resource
+def get_predictor() -> OvulationPredictor:
+    return OvulationPredictor()
+
+def _validate_bleed_duration(start_date: date, end_date: date) -> int:
+    duration = (end_date - start_date).days + 1
+    if duration < 3:
+        raise ValueError(f"Bleed duration {duration} days is too short (Min 3 days).")
+    if duration > 10:
+        raise ValueError(f"Bleed duration {duration} days is too long (Max 10 days).")
+    return duration
+
+@st.cache_data(max_entries=256)
+def _process_history_cached(starts: tuple, ends: tuple):
+    starts = np.array(starts, dtype='datetime64[D]')
+    ends = np.array(ends, dtype='datetime64[D]')
+    # The UI keeps history sorted on insert; only sort foreign input
+    if (np.diff(starts) < np.timedelta64(0, 'D')).any():
+        order = np.argsort(starts, kind='stable')
+        starts = starts[order]
+        ends = ends[order]
+    bleed_durations = (ends - starts).astype('int64') + 1
+    invalid = (bleed_durations < 3) | (bleed_durations > 10)
+    if invalid.any():
+        # Re-check the first bad entry to raise the usual message
+        bad = int(invalid.argmax())
+        _validate_bleed_duration(starts[bad].item(), ends[bad].item())
+    cycle_gaps = np.diff(starts).astype('int64')
+
+    # Bleed Average (Client Logic)
+    if len(bleed_durations) == 1:
+        final_bleed_avg = int(bleed_durations[0])
+    else:
+        avg_raw = bleed_durations.mean()
+        final_bleed_avg = apply_custom_rounding(avg_raw)
+
+    # Cycle Average (Strict Round Up)
+    if not cycle_gaps.size:
+        final_cycle_avg = 28
+    else:
+        avg_cycle_raw = cycle_gaps.mean()
+        final_cycle_avg = math.ceil(avg_cycle_raw)
+
+    return {
+        "bleed_avg": final_bleed_avg,
+        "cycle_avg": final_cycle_avg,
+        "total_cycles": len(starts),
+        "cycle_gaps": cycle_gaps.tolist()
+    }
+
+def _build_predict_table():
+    """
+    Every valid (cycle, bleed) pair mapped to its date-independent offsets:
+    (power_week_duration, main ovulation index, fertile day indices, logic used).
+    Indices are 0-based days from the cycle start.
+    """
+    table = {}
+    for cycle in range(21, 36):
+        for bleed in range(3, _MAX_BLEED[cycle] + 1):
+            power_week_duration = cycle - (bleed + OvulationPredictor.CONSTANTS_SUM)
+            main_ovulation_day_num = (bleed + power_week_duration) - 2
+            main_idx = main_ovulation_day_num - 1
+
+            if power_week_duration <= 5:
+                logic_used = "Power Week Rule (≤ 5 Days)"
+                baby_idx = tuple(range(bleed, bleed + power_week_duration))
+            else:
+                logic_used = "Standard Rule (Main - 4 & + 1)"
+                # Drop days overlapping the bleed (index < bleed)
+                baby_idx = tuple(i for i in range(max(0, main_idx - 4), main_idx + 2) if i >= bleed)
+
+            table[(cycle, bleed)] = (power_week_duration, main_idx, baby_idx, logic_used)
+    return table
+
+_PREDICT_TABLE = _build_predict_table()
+
+@st.cache_data(max_entries=256)
+def _predict_cached(start_date_obj: date, raw_bleed: float, raw_cycle: float):
+    # 1. Rounding Inputs
+    bleed = apply_custom_rounding(raw_bleed)
+    cycle = math.ceil(raw_cycle)
+
+    # 2. Basic Validation
+    if not (3 <= bleed <= 10):
+        raise ValueError(f"Bleed days must be 3-10. (Rounded value: {bleed})")
+    if not (21 <= cycle <= 35):
+        raise ValueError(f"Cycle length must be 21-35. (Rounded value: {cycle})")
+
+    # 3. Complex Validation
+    max_allowed = _MAX_BLEED[cycle]
+    if bleed > max_allowed:
+        raise ValueError(f"For a {cycle}-day cycle, max bleed is {max_allowed}. You have {bleed}.")
+
+    # 4. Timeline Calculation
+    power_week_duration, main_idx, baby_idx, logic_used = _PREDICT_TABLE[(cycle, bleed)]
+
+    # Every day of the cycle is built once and sliced per phase
+    day_arr = np.datetime64(start_date_obj, 'D') + np.arange(cycle)
+    days = day_arr.tolist()
+    iso = np.datetime_as_string(day_arr, unit='D').tolist()
+    pw_idx = bleed
+    c1_idx = pw_idx + power_week_duration
+    nur_idx = c1_idx + OvulationPredictor.CRASH_1
+    c2_idx = nur_idx + OvulationPredictor.NURTURE
+
+    timeline = []
+
+    # Phase 1: Bleed
+    bleed_start = days[0]
+    bleed_end = days[pw_idx - 1]
+    timeline.append({"Phase": "🩸 Bleed Days", "Start": bleed_start, "End": bleed_end, "Days": bleed})
+
+    # Phase 2: Power Week
+    pw_start = days[pw_idx]
+    pw_end = days[c1_idx - 1]
+    timeline.append({"Phase": "⚡ Power Week", "Start": pw_start, "End": pw_end, "Days": power_week_duration})
+
+    # Vacation Mode (Calculated for JSON and Summary)
+    vacation_start = days[pw_idx - 2]
+    vacation_end = pw_end
+
+    # Phase 3: Crash 1
+    c1_start = days[c1_idx]
+    c1_end = days[nur_idx - 1]
+    timeline.append({"Phase": "📉 Crash #1", "Start": c1_start, "End": c1_end, "Days": OvulationPredictor.CRASH_1})
+
+    # Phase 4: Nurture
+    nur_start = days[nur_idx]
+    nur_end = days[c2_idx - 1]
+    timeline.append({"Phase": "🌱 Nurture", "Start": nur_start, "End": nur_end, "Days": OvulationPredictor.NURTURE})
+
+    # Phase 5: Crash 2
+    c2_start = days[c2_idx]
+    c2_end = days[c2_idx + OvulationPredictor.CRASH_2 - 1]
+    timeline.append({"Phase": "📉 Crash #2", "Start": c2_start, "End": c2_end, "Days": OvulationPredictor.CRASH_2})
+
+    # --- Fertile Window (offsets precomputed in _PREDICT_TABLE) ---
+    main_date = days[main_idx]
+    final_baby_days = [days[i] for i in baby_idx]
+
+    # --- CONSTRUCT JSON DATA ---
+    # Using exact calculated dates to ensure JSON matches the Logic
+    json_data = {
+        "bleed_week": {
+            "start": iso[0],
+            "end": iso[pw_idx - 1],
+            "color": "0xFFE91E63",
+        },
+        "power_week": {
+            "start": iso[pw_idx],
+            "end": iso[c1_idx - 1],
+            "color": "0xFF68D20D",
+        },
+        "vacation_mode": {
+            "start": iso[pw_idx - 2],
+            "end": iso[c1_idx - 1],
+            "color": "0xFFFFFF00",
+        },
+        "main_ovulation_day": iso[main_idx],
+        "ovulation_days": {
+            "start": iso[baby_idx[0]] if baby_idx else "",
+            "end": iso[baby_idx[-1]] if baby_idx else "",
+            "color": "0xFFFFC0CB",
+        },
+        "crash_round_1": {
+            "start": iso[c1_idx],
+            "end": iso[nur_idx - 1],
+            "color": "0xFFFFC107",
+        },
+        "nurture_week": {
+            "start": iso[nur_idx],
+            "end": iso[c2_idx - 1],
+            "color": "0xFF8E8E8E",
+        },
+        "crash_round_2": {
+            "start": iso[c2_idx],
+            "end": iso[-1],
+            "color": "0xFFFFC107",
+        }
+    }
+
+    return {
+        "rounded_bleed": bleed,
+        "rounded_cycle": cycle,
+        "power_week": power_week_duration,
+        "main_date": main_date,
+        "baby_days": final_baby_days,
+        "timeline": timeline,
+        "logic_used": logic_used,
+        "vacation_mode": {"start": vacation_start, "end": vacation_end},
+        "phase_indices": _PHASE_INDICES,
+        "json_output": json_data
+    }
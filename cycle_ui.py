@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import streamlit as st
+import bisect
+import numpy as np
+from datetime import timedelta, date
+from typing import TYPE_CHECKING
+
+from cycle_core import CycleHistoryCalculator, OvulationPredictor, get_history_calc, get_predictor
+
+# pandas and orjson are imported where they are used so the first page
+# render does not pay for them
+if TYPE_CHECKING:
+    import pandas as pd
+
+# date.toordinal() of 1970-01-01, for turning ordinals into pandas datetimes
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+APP_MODES = ("Algo #01: History Calculation", "Algo #02: Future Prediction")
+
+# ==========================================
+# CACHED DISPLAY TABLES
+# ==========================================
+
+@st.cache_data(max_entries=256)
+def _history_display_rows(starts: tuple, ends: tuple) -> pd.DataFrame:
+    import pandas as pd
+
+    starts = pd.to_datetime(starts)
+    ends = pd.to_datetime(ends)
+    return pd.DataFrame({
+        "Cycle #": np.arange(1, len(starts) + 1),
+        "Start": starts.strftime("%Y-%m-%d"),
+        "End": ends.strftime("%Y-%m-%d"),
+        "Duration": ((ends - starts).days + 1).astype(str) + " days"
+    })
+
+@st.cache_data(max_entries=256)
+def _timeline_display_df(timeline_fingerprint: tuple) -> pd.DataFrame:
+    import pandas as pd
+
+    phases, start_ords, end_ords, days = zip(*timeline_fingerprint)
+    starts = pd.to_datetime(np.array(start_ords) - _EPOCH_ORDINAL, unit="D")
+    ends = pd.to_datetime(np.array(end_ords) - _EPOCH_ORDINAL, unit="D")
+    return pd.DataFrame({
+        "Phase Name": phases,
+        "Start Date": starts.strftime("%d %b %Y"),
+        "End Date": ends.strftime("%d %b %Y"),
+        "Duration": pd.Index(days).astype(str) + " Days"
+    })
+
+# ==========================================
+# PAGES
+# ==========================================
+
+# --- PAGE 1: ALGO #01 ---
+def render_history_page(calc: CycleHistoryCalculator):
+    st.title("📜 Algo #01: History & Averages")
+    st.markdown("---")
+    
+    st.session_state.setdefault('history_starts', [])
+    st.session_state.setdefault('history_ends', [])
+
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        st.subheader("1. Add Past Cycle")
+        with st.form("add_cycle_form"):
+            h_start = st.date_input("Bleed Start Date", value=date.today())
+            h_end = st.date_input("Bleed End Date", value=date.today() + timedelta(days=4))
+            submitted = st.form_submit_button("Add to History")
+            
+            if submitted:
+                calc_check = calc
+                try:
+                    calc_check.validate_single_entry(h_start, h_end)
+                    i = bisect.bisect_right(st.session_state['history_starts'], h_start)
+                    st.session_state['history_starts'].insert(i, h_start)
+                    st.session_state['history_ends'].insert(i, h_end)
+                    st.success("Added!")
+                except ValueError as e:
+                    st.error(str(e))
+
+        if st.button("Reset History"):
+            st.session_state['history_starts'] = []
+            st.session_state['history_ends'] = []
+            st.rerun()
+
+    with col2:
+        st.subheader("2. Results")
+        starts = st.session_state['history_starts']
+        ends = st.session_state['history_ends']
+        if starts:
+            st.dataframe(_history_display_rows(tuple(starts), tuple(ends)), use_container_width=True)
+
+            algo1 = calc
+            try:
+                res = algo1.process_history(starts, ends)
+                st.success("### Final Averages")
+                m1, m2 = st.columns(2)
+                m1.metric("Avg Bleed (Custom Rule)", f"{res['bleed_avg']} Days")
+                m2.metric("Avg Cycle (Round Up)", f"{res['cycle_avg']} Days")
+            except Exception as e:
+                st.error(f"Error: {e}")
+        else:
+            st.warning("Please add at least one cycle entry on the left.")
+
+# --- PAGE 2: ALGO #02 ---
+def render_predict_page(predictor: OvulationPredictor):
+    st.title("🔮 Algo #02: Prediction & Timeline")
+    st.markdown("---")
+    
+    st.write("Enter your data below to see the **Full Cycle Roadmap**.")
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        p_start = st.date_input("Cycle Start Date (Day 1)", value=date(2026, 1, 1))
+    with c2:
+        # Step=0.1 to test decimal inputs like 5.75
+        p_bleed = st.number_input("Bleed Duration (Avg)", min_value=0.0, max_value=15.0, value=5.7, step=0.1)
+    with c3:
+        p_cycle = st.number_input("Cycle Duration (Avg)", min_value=0.0, max_value=50.0, value=28.0, step=0.1)
+
+    if st.button("Generate Cycle Roadmap", type="primary"):
+        algo2 = predictor
+        try:
+            res = algo2.predict(p_start, p_bleed, p_cycle)
+            
+            # --- SECTION 1: KEY STATS ---
+            st.divider()
+            st.subheader("1. Key Calculations")
+            k1, k2, k3 = st.columns(3)
+            k1.info(f"**Bleed:** {res['rounded_bleed']} Days")
+            k2.info(f"**Power Week:** {res['power_week']} Days")
+            k3.info(f"**Total Cycle:** {res['rounded_cycle']} Days")
+
+            # --- SECTION 2: FULL TIMELINE ---
+            st.subheader("2. 📅 Full Cycle Timeline")
+            
+            # Add Vacation Mode to display table (Optional, but good for visibility)
+            display_timeline = list(res['timeline'])
+            vacation_start = res['vacation_mode']['start']
+            vacation_end = res['vacation_mode']['end']
+            vacation_days = (vacation_end - vacation_start).days + 1
+            
+            # Insert Vacation Mode after Power Week for Table View
+            pw_index = res['phase_indices']['power_week']
+            display_timeline.insert(pw_index + 1, {
+                "Phase": "🏖️ Vacation Mode",
+                "Start": vacation_start,
+                "End": vacation_end,
+                "Days": vacation_days
+            })
+
+            timeline_fingerprint = tuple(
+                (p["Phase"], p["Start"].toordinal(), p["End"].toordinal(), p["Days"])
+                for p in display_timeline
+            )
+            df_timeline = _timeline_display_df(timeline_fingerprint)
+            st.table(df_timeline)
+
+            # --- SECTION 3: FERTILE WINDOW ---
+            st.subheader("3. ❤️ Fertile Window (Baby Days)")
+            st.caption(f"**Applied Logic:** {res['logic_used']}")
+            
+            if len(res['baby_days']) == 0:
+                 st.warning("All calculated fertile days overlap with Bleed days.")
+            else:
+                cols = st.columns(len(res['baby_days']))
+                for i, day_obj in enumerate(res['baby_days']):
+                    date_str = day_obj.strftime("%d %b")
+                    is_main = (day_obj == res['main_date'])
+                    if i < len(cols):
+                        with cols[i]:
+                            if is_main:
+                                st.error(f"**{date_str}**\n\n(Main)")
+                            else:
+                                st.success(f"{date_str}")
+                
+                if res['logic_used'].startswith("Standard"):
+                    st.caption("Note: Any fertile days overlapping with Bleed days have been hidden.")
+
+            # --- SECTION 4: DOWNLOAD JSON ---
+            st.divider()
+            st.subheader("4. 📥 Download Data")
+            
+            # Convert Dict to JSON String
+            import orjson
+            json_string = orjson.dumps(res['json_output'], option=orjson.OPT_INDENT_2).decode()
+            
+            st.download_button(
+                label="Download JSON Calculation",
+                data=json_string,
+                file_name="cycle_calculation.json",
+                mime="application/json"
+            )
+
+        except ValueError as e:
+            st.error(f"❌ **VALIDATION FAILED:** {str(e)}")
+            st.markdown("""
+            **Rules:**
+            * Bleed: 3-10 days
+            * Cycle: 21-35 days
+            * Max Bleed logic applies based on cycle length.
+            """)
+
+# ==========================================
+# UI CONFIGURATION
+# ==========================================
+
+def run_app():
+    st.set_page_config(page_title="Cycle Algorithms", page_icon="🩸", layout="wide")
+
+    st.sidebar.title("Navigation")
+    app_mode = st.sidebar.radio("Choose Algorithm:", APP_MODES, key="app_mode")
+    st.sidebar.divider()
+    st.sidebar.info("Use the menu above to switch between History Calculator and Future Prediction.")
+
+    if app_mode == APP_MODES[0]:
+        render_history_page(get_history_calc())
+    elif app_mode == APP_MODES[1]:
+        render_predict_page(get_predictor())